@@ -4,9 +4,18 @@ They take the form: "path/to/file.ato:Entry.Path::instance.path"
 Addresses go by other names in various files for historical reasons - but should be upgraded.
 
 This file provides utilities for working with addresses.
+
+The most frequently hit accessors are pure functions of the address string,
+so they're cached; builds look the same handful of addresses up many times.
+The caches are bounded, since long-lived processes (eg. the language server)
+see new addresses on every edit.
 """
 from typing import Optional, Iterable
-from functools import wraps
+from functools import lru_cache, wraps
+
+
+# Roughly enough for every instance in a large design, with room to spare
+_ACCESSOR_CACHE_SIZE = 2**14
 
 
 class AddrStr(str):
@@ -74,6 +83,7 @@ def get_relative_addr_str(address: AddrStr) -> AddrStr:
     return address.split("/")[-1]
 
 
+@lru_cache(maxsize=_ACCESSOR_CACHE_SIZE)
 def get_entry(address: AddrStr) -> AddrStr:
     """
     Extract the root path from an address.
@@ -81,6 +91,7 @@ def get_entry(address: AddrStr) -> AddrStr:
     return address.split("::")[0]
 
 
+@lru_cache(maxsize=_ACCESSOR_CACHE_SIZE)
 @_handle_windows
 def get_entry_section(address: AddrStr) -> Optional[str]:
     """
@@ -92,6 +103,7 @@ def get_entry_section(address: AddrStr) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=_ACCESSOR_CACHE_SIZE)
 @_handle_windows
 def get_instance_section(address: AddrStr) -> Optional[str]:
     """
@@ -103,6 +115,7 @@ def get_instance_section(address: AddrStr) -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=_ACCESSOR_CACHE_SIZE)
 def get_name(address: AddrStr) -> str:
     """
     Extract name from the end of the sequence.
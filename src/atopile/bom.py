@@ -25,6 +25,15 @@ log = logging.getLogger(__name__)
 _get_mpn = errors.downgrade(
     components.get_mpn, (components.MissingData, components.NoMatchingComponent)
 )
+_get_package = errors.downgrade(components.get_package, components.MissingData)
+_get_downgraded_footprint = errors.downgrade(
+    components.get_footprint, components.MissingData
+)
+_get_user_facing_value = errors.downgrade(
+    components.get_user_facing_value,
+    (components.MissingData, components.NoMatchingComponent)
+)
+_get_specd_value = errors.downgrade(components.get_specd_value, components.MissingData)
 
 
 def _get_footprint(addr: address.AddrStr) -> str:
@@ -35,33 +44,22 @@ def _get_footprint(addr: address.AddrStr) -> str:
     Then it attempts to use the package
     Finally, it'll fallback to a question mark "?"
     """
-    if value := errors.downgrade(
-        components.get_package,
-        components.MissingData
-    )(addr):
+    if value := _get_package(addr):
         return value
 
-    if value := errors.downgrade(
-        components.get_footprint,
-        components.MissingData
-    )(addr):
+    if value := _get_downgraded_footprint(addr):
         return value
 
     return "?"
 
 
 def _get_value(addr: address.AddrStr) -> str:
-    value = errors.downgrade(
-        components.get_user_facing_value,
-        (components.MissingData, components.NoMatchingComponent)
-    )(addr)
+    value = _get_user_facing_value(addr)
 
     if value is not None:
         return value
 
-    value = str(errors.downgrade(
-        components.get_specd_value, components.MissingData
-    )(addr))
+    value = str(_get_specd_value(addr))
 
     if value is not None:
         return value
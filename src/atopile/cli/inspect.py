@@ -77,20 +77,27 @@ def find_nets(links: list[Link]) -> list[list[AddrStr]]:
             graph[source].append(target)
             graph[target].append(source)
 
-    def dfs(node, component):
-        visited.add(node)
-        component.append(node)
-        for neighbor in graph.get(node, []):
-            if neighbor not in visited:
-                dfs(neighbor, component)
-
+    # depth-first walk with an explicit stack of neighbour iterators, rather
+    # than recursing, so large nets don't pay a frame per node (or hit the
+    # recursion limit)
     connected_components = []
     visited = set()
     for node in graph:
-        if node not in visited:
-            component = []
-            dfs(node, component)
-            connected_components.append(component)
+        if node in visited:
+            continue
+        visited.add(node)
+        component = [node]
+        stack = [iter(graph[node])]
+        while stack:
+            for neighbor in stack[-1]:
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    component.append(neighbor)
+                    stack.append(iter(graph[neighbor]))
+                    break
+            else:
+                stack.pop()
+        connected_components.append(component)
 
     return connected_components
 
@@ -98,6 +105,8 @@ def find_nets(links: list[Link]) -> list[list[AddrStr]]:
 # nested interfaces or signals within the interface modules
 def find_net_hits(net: list[AddrStr], links: list[Link]) -> list[AddrStr]:
     hits = []
+    # every link end is tested against the net, so make that a hash lookup
+    net_members = set(net)
     for link in links:
         source = []
         target = []
@@ -120,9 +129,9 @@ def find_net_hits(net: list[AddrStr], links: list[Link]) -> list[AddrStr]:
             target.append(link.target.addr)
 
         for source, target in zip(source, target):
-            if source in net:
+            if source in net_members:
                 hits.append(target)
-            if target in net:
+            if target in net_members:
                 hits.append(source)
     return hits
 
@@ -1,6 +1,7 @@
 import json
 import logging
 import time
+from collections import defaultdict
 from datetime import datetime, timedelta
 from functools import cache
 from pathlib import Path
@@ -77,9 +78,9 @@ def save_cache():
     """Saves the current state of the cache to a file."""
     cache_file_path.parent.mkdir(parents=True, exist_ok=True)
     with open(cache_file_path, "w") as cache_file:
-        # Convert the ChainMap to a regular dictionary
-        serializable_cache = dict(component_cache)
-        json.dump(serializable_cache, cache_file)
+        # The cache is already a plain dict, so stream it straight to the file
+        # rather than building a copy of it first
+        json.dump(component_cache, cache_file)
 
 
 def get_component_from_cache(component_addr: AddrStr, current_data: dict) -> Optional[dict]:
@@ -384,18 +385,22 @@ class DesignatorManager:
                     unnamed_components.append(component)
 
         # second pass: assign designators to the unnamed components
+        # remember where we got up to for each prefix, so we don't re-check
+        # every designator we've already handed out for each new component
+        next_index_by_prefix: dict[str, int] = defaultdict(lambda: 1)
         for component in unnamed_components:
             try:
                 prefix = instance_methods.get_data(component, "designator_prefix")
             except KeyError:
                 prefix = "U"
 
-            i = 1
+            i = next_index_by_prefix[prefix]
             while f"{prefix}{i}" in used_designators:
                 i += 1
 
             designators[component] = f"{prefix}{i}"
             used_designators.add(designators[component])
+            next_index_by_prefix[prefix] = i + 1
 
         return designators
 
@@ -67,7 +67,7 @@ class KeyOptMap(tuple[KeyOptItem[T]]):
 
     def named_items(self) -> Mapping[Ref, T]:
         """Return all the named items in this set, ignoring the unnamed ones."""
-        return dict(filter(lambda x: x.ref is not None, self))
+        return {item.ref: item.value for item in self if item.ref is not None}
 
     def map_items_by_type(
         self, types: Iterable[Type | Iterable[Type]]
@@ -77,19 +77,19 @@ class KeyOptMap(tuple[KeyOptItem[T]]):
 
     def unnamed_items(self) -> Iterable[T]:
         """Return an interable of all the unnamed items in this set."""
-        return map(lambda x: x.value, filter(lambda x: x.ref is None, self))
+        return (item.value for item in self if item.ref is None)
 
     def filter_items_by_type(self, types: Type | Iterable[Type]) -> Iterator[T]:
         """Helper function to filter by type."""
-        return filter(lambda x: isinstance(x.value, types), self)
+        return (item for item in self if isinstance(item.value, types))
 
     def keys(self) -> Iterable[Ref]:
         """Return an iterable of all the names in this set."""
-        return map(lambda x: x.ref, filter(lambda x: x.ref is not None, self))
+        return (item.ref for item in self if item.ref is not None)
 
     def values(self) -> Iterable[T]:
         """Return an iterable of all the values in this set."""
-        return map(lambda x: x.value, self)
+        return (item.value for item in self)
 
     def strain(self) -> "Strainer[KeyOptItem[T]]":
         """Return a Strainer for this KeyOptMap."""
@@ -48,6 +48,13 @@ def _favourable_unit(unit: PlainUnit) -> PlainUnit:
     return unit
 
 
+def _tolerance_pct(nominal: float, tolerance: float) -> Optional[float]:
+    """Return a tolerance as a percentage of its nominal value, if it has one."""
+    if nominal == 0:
+        return None
+    return tolerance / nominal * 100
+
+
 class RangedValue:
     """
     Let's get physical!
@@ -168,20 +175,22 @@ class RangedValue:
     @property
     def tolerance_pct(self) -> Optional[float]:
         """Return the tolerance as a percentage of the nominal value."""
-        if self.nominal == 0:
-            return None
-        return self.tolerance / self.nominal * 100
+        return _tolerance_pct(self.nominal, self.tolerance)
 
     def to_dict(self) -> dict:
         """Convert the Physical instance to a dictionary."""
+        # compute the derived values once here, rather than through the
+        # properties, which would work out the nominal value twice
+        nominal = self.nominal
+        tolerance = self.tolerance
         return {
             "unit": str(self.unit),
             "min_val": self.min_val,
             "max_val": self.max_val,
             # TODO: remove these - we shouldn't be duplicating this kind of information
-            "nominal": self.nominal,
-            "tolerance": self.tolerance,
-            "tolerance_pct": self.tolerance_pct,
+            "nominal": nominal,
+            "tolerance": tolerance,
+            "tolerance_pct": _tolerance_pct(nominal, tolerance),
         }
 
     @property
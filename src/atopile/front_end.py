@@ -6,8 +6,9 @@ In building this datamodel, we check for name collisions, but we don't resolve t
 
 import enum
 import operator
+import sys
 from collections import defaultdict, deque
-from contextlib import ExitStack, contextmanager
+from contextlib import contextmanager
 from itertools import chain
 from numbers import Number
 from pathlib import Path
@@ -204,7 +205,11 @@ resolve_types(ClassLayer)
 ## The below datastructures are created from the above data-model as a second stage
 
 
-@define
+# Links and Instances reference each other (parent, children, links),
+# so attrs' generated field-by-field __eq__ is both expensive and meaningless.
+# Compare and hash them by identity instead. eq=False alone isn't enough, since
+# they'd then inherit Base's generated __eq__ (over src_ctx) and __hash__ = None.
+@define(eq=False)
 class Link(Base):
     """Represent a connection between two connectable things."""
 
@@ -219,11 +224,14 @@ class Link(Base):
     source: "Instance"
     target: "Instance"
 
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
     def __repr__(self) -> str:
         return f"<Link {repr(self.source)} -> {repr(self.target)}>"
 
 
-@define
+@define(eq=False)
 class Instance(Base):
     """
     Represents the specific instance, capturing, the story you told of
@@ -243,6 +251,9 @@ class Instance(Base):
     children: dict[str, "Instance"] = field(factory=dict)
     links: list[Link] = field(factory=list)
 
+    __eq__ = object.__eq__
+    __hash__ = object.__hash__
+
     def __repr__(self) -> str:
         return f"<Instance {self.addr}>"
 
@@ -365,8 +376,11 @@ class HandlesPrimaries(AtopileParserVisitor):
     def visitName(self, ctx: ap.NameContext) -> str:
         """
         If this is an int, convert it to one (for pins), else return the name as a string.
+
+        Names are interned, since the same handful are repeated across every
+        instance of a class and end up as keys in lots of dicts.
         """
-        return ctx.getText()
+        return sys.intern(ctx.getText())
 
     def visitAttr(self, ctx: ap.AttrContext) -> Ref:
         return Ref(self.visitName(name) for name in ctx.name())
@@ -1196,22 +1210,29 @@ class Lofty(HandleStmtsFunctional, HandlesPrimaries):
         self._output_cache[new_addr] = new_instance
 
         if self._instance_addr_stack:
-            child_addr = address.get_name(new_addr)
+            child_addr = sys.intern(address.get_name(new_addr))
             parent_instance.children[child_addr] = new_instance
 
+        # This runs for every instance in the tree, so push and pop the
+        # stacks by hand rather than through a context manager per entry
         try:
-            with ExitStack() as stack:
-                stack.enter_context(self._instance_addr_stack.enter(new_addr))
-                stack.enter_context(self.apply_replacements_from_objs(new_instance.supers))
-                for super_obj_ in reversed(new_instance.supers):
-                    stack.enter_context(self._class_addr_stack.enter(super_obj_.address))
-                    if super_obj_.src_ctx is None:
-                        # FIXME: this is currently the case for the builtins
-                        continue
-
-                    # visit the internals (eg. all the new statements, overrides etc...)
-                    # of the things we're inheriting from
-                    self.visitBlock(super_obj_.src_ctx)
+            self._instance_addr_stack.append(new_addr)
+            try:
+                with self.apply_replacements_from_objs(new_instance.supers):
+                    for super_obj_ in reversed(new_instance.supers):
+                        if super_obj_.src_ctx is None:
+                            # FIXME: this is currently the case for the builtins
+                            continue
+
+                        # visit the internals (eg. all the new statements, overrides etc...)
+                        # of the things we're inheriting from
+                        self._class_addr_stack.append(super_obj_.address)
+                        try:
+                            self.visitBlock(super_obj_.src_ctx)
+                        finally:
+                            self._class_addr_stack.pop()
+            finally:
+                self._instance_addr_stack.pop()
         except Exception:
             if new_addr in self._output_cache:
                 del self._output_cache[new_addr]
@@ -1319,7 +1340,7 @@ class Lofty(HandleStmtsFunctional, HandlesPrimaries):
         """This function makes a pin or signal instance and sticks it in the instance tree."""
         # NOTE: name has to come first because both have names,
         # but only pins have a "totally an integer"
-        name = (ctx.name() or ctx.totally_an_integer()).getText()
+        name = sys.intern((ctx.name() or ctx.totally_an_integer()).getText())
 
         current_instance_addr = self._instance_addr_stack.top
         current_instance = self._output_cache[current_instance_addr]
@@ -28,13 +28,29 @@ def get_data(addr: str, key: str) -> Any:
     raise errors.AtoKeyError(f"{addr} has no attribute {key}")
 
 
+def _all_descendants(instance: Instance) -> Iterable[Instance]:
+    """
+    Return the instances under (and including) the given one in depth-first order
+    """
+    # iterative post-order walk, so deep trees don't pay for
+    # a chain of nested generators on every yield
+    stack = [(instance, iter(instance.children.values()))]
+    while stack:
+        current, children = stack[-1]
+        for child in children:
+            stack.append((child, iter(child.children.values())))
+            break
+        else:
+            stack.pop()
+            yield current
+
+
 def all_descendants(addr: str) -> Iterable[str]:
     """
     Return a list of addresses in depth-first order
     """
-    for child in get_children(addr):
-        yield from all_descendants(child)
-    yield addr
+    for instance in _all_descendants(lofty.get_instance(addr)):
+        yield instance.addr
 
 
 def _common_children(*instances: Instance) -> Iterable[tuple[Instance]]:
@@ -65,11 +81,14 @@ def _make_dumb_matcher(pass_list: Iterable[str]) -> Callable[[str], bool]:
     """
     Return a filter that checks if the addr is in the pass_list
     """
+    # index the pass list once, so each check is a hash lookup
+    # rather than a scan over the list of candidates
+    pass_set = frozenset(pass_list)
 
     def _filter(addr: AddrStr) -> bool:
         instance = lofty.get_instance(addr)
         for super_ in reversed(instance.supers):
-            if super_.address in pass_list:
+            if super_.address in pass_set:
                 return True
         return False
 
@@ -79,7 +98,7 @@ def _make_dumb_matcher(pass_list: Iterable[str]) -> Callable[[str], bool]:
 match_components = _make_dumb_matcher(["<Built-in>:Component"])
 match_modules = _make_dumb_matcher(["<Built-in>:Module"])
 match_signals = _make_dumb_matcher(["<Built-in>:Signal"])
-match_pins = _make_dumb_matcher("<Built-in>:Pin")
+match_pins = _make_dumb_matcher(["<Built-in>:Pin"])
 match_pins_and_signals = _make_dumb_matcher(["<Built-in>:Pin", "<Built-in>:Signal"])
 match_interfaces = _make_dumb_matcher(["<Built-in>:Interface"])
 match_sentinels = _make_dumb_matcher(
@@ -100,8 +119,9 @@ def find_matching_super(
     candidate_supers, or None if none are.
     """
     supers = get_supers_list(addr)
+    candidate_set = set(candidate_supers)
     for duper in supers:
-        if any(duper.address == pt for pt in candidate_supers):
+        if duper.address in candidate_set:
             return duper.address
     return None
 
@@ -128,8 +148,12 @@ def get_parent(addr: AddrStr) -> Optional[AddrStr]:
 
 def iter_parents(addr: AddrStr) -> Iterable[AddrStr]:
     """Iterate over the parents of the given address"""
-    while addr := get_parent(addr):
-        yield addr
+    # follow the parent references directly, instead of
+    # looking each parent back up by its address
+    instance = lofty.get_instance(addr).parent
+    while instance:
+        yield instance.addr
+        instance = instance.parent
 
 
 def get_links(addr: AddrStr) -> Iterable[Link]:
@@ -79,8 +79,9 @@ class LoopItem(collections.abc.Iterable[T]):
         # if neither is lonely, check if they are already joined
         # If not, join them
         else:
-            a_loop_items = list(a.iter_loop())
-            if b not in a_loop_items:
+            # walk the loop in place rather than materialising it,
+            # bailing as soon as we find b
+            if not any(item is b for item in a.iter_loop()):
                 a_old_next = a.next
                 b_old_prev = b.prev
                 a.next = b
@@ -8,7 +8,6 @@ from atopile.address import AddrStr
 from atopile.datatypes import Ref
 from atopile.instance_methods import (
     all_descendants,
-    get_children,
     get_links,
     iter_parents,
     get_parent,
@@ -18,32 +17,51 @@ from atopile.instance_methods import (
     match_modules,
 )
 from atopile.loop_soup import LoopSoup
-from atopile.address import get_name, add_instance
+from atopile.address import get_name
 
 
 def get_nets(root: AddrStr) -> Iterable[Iterable[str]]:
     """Find all the nets under a given root."""
     net_soup = LoopSoup()
+    interfaces: set[AddrStr] = set()
     for addr in all_descendants(root):
+        # Classify each instance once as we pass it. Descendants come before
+        # the instance holding their links, so by the time we reach a link
+        # both of its ends have already been classified.
         if match_pins_and_signals(addr):
             net_soup.add(addr)
+        if match_interfaces(addr):
+            interfaces.add(addr)
+
         for link in get_links(addr):
             source = link.source.addr
             target = link.target.addr
-
-            if match_interfaces(source) and match_interfaces(target):
-                for int_pin in get_children(source):
-                    if match_pins_and_signals(int_pin):
-                        net_soup.join(int_pin, add_instance(target, get_name(int_pin)))
-                    else:
+            source_is_interface = source in interfaces
+            target_is_interface = target in interfaces
+
+            if source_is_interface and target_is_interface:
+                # walk the link's source instance directly, rather than
+                # re-resolving each of its children from an address
+                for int_pin_name, int_pin in link.source.children.items():
+                    if int_pin.addr not in net_soup:
                         raise errors.AtoNotImplementedError("Cannot nest interfaces yet.")
-            elif match_interfaces(source) or match_interfaces(target):
+                    # the matching pin's address is already on its instance,
+                    # so there's no need to build it up again from the name
+                    try:
+                        target_pin = link.target.children[int_pin_name]
+                    except KeyError as ex:
+                        raise errors.AtoKeyError.from_ctx(
+                            link.src_ctx,
+                            f"{target} has no pin or signal named {int_pin_name}"
+                        ) from ex
+                    net_soup.join(int_pin.addr, target_pin.addr)
+            elif source_is_interface or target_is_interface:
                 # If only one of the nodes is an interface, then we need to throw an error
                 raise errors.AtoTypeError.from_ctx(
                     link.src_ctx,
                     f"Cannot connect an interface to a non-interface: {source} ~ {target}"
                 )
-            elif match_pins_and_signals(source) and match_pins_and_signals(target):
+            elif source in net_soup and target in net_soup:
                 net_soup.join(source, target)
             else:
                 # If only one of the nodes is an pin or signal, then we need to throw an error
@@ -80,16 +98,19 @@ class _Net:
 
     def generate_base_net_name(self) -> None:
         """Generate the base_name attribute."""
-        min_depth = 100
-        for signal in filter(match_signals, self.nodes_on_net):
-            min_depth = min(min_depth, len(list(iter_parents(signal))))
+        # walking up the parents is the expensive bit, so do it once per signal
+        depths = {
+            signal: len(list(iter_parents(signal)))
+            for signal in filter(match_signals, self.nodes_on_net)
+        }
+        min_depth = min(depths.values(), default=100)
 
         name_candidates = defaultdict(int)
-        for signal in filter(match_signals, self.nodes_on_net):
+        for signal, depth in depths.items():
             # lower case so we are not case sensitive
             name = get_name(signal).lower()
             # only rank signals at highest level
-            if min_depth == len(list(iter_parents(signal))):
+            if min_depth == depth:
                 if name in ['p1', 'p2']:
                     # Ignore 2 pin component signals
                     name_candidates[name] = 0
@@ -97,7 +118,7 @@ class _Net:
                     name_candidates[name] += 1
 
             elif match_interfaces(get_parent(signal)):
-                if min_depth + 1 == len(list(iter_parents(signal))):
+                if min_depth + 1 == depth:
                     # Give interfaces on the same level a chance!
                     name_candidates[name] += 1
 
@@ -0,0 +1,60 @@
+from collections import deque
+
+import pytest
+
+from atopile.components import DesignatorManager
+from atopile.front_end import COMPONENT, MODULE, Assignment, Instance, lofty
+
+ROOT = "test.ato:Root::"
+
+
+def _make_component(root: Instance, name: str, **data) -> Instance:
+    component = Instance(
+        addr=ROOT + name,
+        supers=[COMPONENT],
+        assignments={
+            k: deque([Assignment(name=k, value=v, given_type=None)])
+            for k, v in data.items()
+        },
+        parent=root,
+    )
+    root.children[name] = component
+    return component
+
+
+@pytest.fixture
+def root(monkeypatch) -> Instance:
+    root = Instance(addr=ROOT, supers=[MODULE], assignments={}, parent=None)
+    output_cache = {ROOT: root}
+    monkeypatch.setattr(lofty, "_output_cache", output_cache)
+    return root
+
+
+def test_make_designators(root: Instance):
+    _make_component(root, "r_pre", designator="R2")
+    _make_component(root, "u_pre", designator="U3")
+    for name in ["r_a", "r_b", "r_c"]:
+        _make_component(root, name, designator_prefix="R")
+    # "U1" + 1 overlaps with the "U" prefix's 11th designator
+    _make_component(root, "x_a", designator_prefix="U1")
+    u_names = [f"u_{i}" for i in range(11)]
+    for name in u_names:
+        _make_component(root, name)
+    _make_component(root, "x_b", designator_prefix="U1")
+
+    lofty._output_cache.update({c.addr: c for c in root.children.values()})
+
+    designators = DesignatorManager()._make_designators(ROOT)
+
+    def _des(name: str) -> str:
+        return designators[ROOT + name]
+
+    assert _des("r_pre") == "R2"
+    assert _des("u_pre") == "U3"
+    assert [_des(n) for n in ["r_a", "r_b", "r_c"]] == ["R1", "R3", "R4"]
+    assert _des("x_a") == "U11"
+    assert [_des(n) for n in u_names] == [
+        "U1", "U2", "U4", "U5", "U6", "U7", "U8", "U9", "U10", "U12", "U13"
+    ]
+    assert _des("x_b") == "U14"
+    assert len(set(designators.values())) == len(designators)
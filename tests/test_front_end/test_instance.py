@@ -0,0 +1,37 @@
+from unittest.mock import MagicMock
+
+from atopile.front_end import Instance, Link
+
+
+def _make_instance(addr: str, src_ctx) -> Instance:
+    return Instance(
+        src_ctx=src_ctx,
+        addr=addr,
+        supers=[],
+        assignments={},
+        parent=None,
+    )
+
+
+def test_instances_compare_by_identity():
+    ctx = MagicMock()
+    a = _make_instance("//a:b::r1.p1", ctx)
+    b = _make_instance("//a:b::r2.p1", ctx)
+
+    assert a == a
+    assert a != b
+    assert len({a, b}) == 2
+
+
+def test_links_compare_by_identity():
+    ctx = MagicMock()
+    parent = _make_instance("//a:b::", ctx)
+    source = _make_instance("//a:b::x", ctx)
+    target = _make_instance("//a:b::y", ctx)
+
+    link_a = Link(src_ctx=ctx, parent=parent, source=source, target=target)
+    link_b = Link(src_ctx=ctx, parent=parent, source=source, target=target)
+
+    assert link_a == link_a
+    assert link_a != link_b
+    assert len({link_a, link_b}) == 2
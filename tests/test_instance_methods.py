@@ -20,3 +20,19 @@ def test_common_children():
 
     b = MagicMock(children={"a": MagicMock(children={})})
     assert list(instance_methods._common_children(a, b)) == [(a.children["a"], b.children["a"])]
+
+
+def test_all_descendants():
+    leaf_a = MagicMock(children={})
+    leaf_b = MagicMock(children={})
+    mid = MagicMock(children={"a": leaf_a, "b": leaf_b})
+    leaf_c = MagicMock(children={})
+    root = MagicMock(children={"mid": mid, "c": leaf_c})
+
+    assert list(instance_methods._all_descendants(root)) == [
+        leaf_a,
+        leaf_b,
+        mid,
+        leaf_c,
+        root,
+    ]
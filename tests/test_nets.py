@@ -1,5 +1,12 @@
+from unittest.mock import MagicMock
+
 import pytest
-from atopile.nets import _Net
+
+from atopile import errors
+from atopile.address import get_name
+from atopile.front_end import INTERFACE, MODULE, SIGNAL, Instance, Link, lofty
+from atopile.instance_methods import _all_descendants
+from atopile.nets import _Net, get_nets
 
 @pytest.fixture
 def net():
@@ -21,3 +28,53 @@ def test_net_name(net: _Net, prefix, base, suffix, expected):
     net.base_name = base
     net.suffix = suffix
     assert net.get_name() == expected
+
+
+def _make_instance(addr, super_, parent=None):
+    instance = Instance(addr=addr, supers=[super_], assignments={}, parent=parent)
+    if parent is not None:
+        parent.children[get_name(addr)] = instance
+    return instance
+
+
+def _make_interface(addr, parent, pin_names):
+    interface = _make_instance(addr, INTERFACE, parent)
+    for pin_name in pin_names:
+        _make_instance(f"{addr}.{pin_name}", SIGNAL, interface)
+    return interface
+
+
+@pytest.fixture
+def linked_interfaces(monkeypatch):
+    """Make a root module with two interfaces connected together."""
+    def _make(source_pins, target_pins):
+        root = _make_instance("test.ato:Root::", MODULE)
+        source = _make_interface("test.ato:Root::a", root, source_pins)
+        target = _make_interface("test.ato:Root::b", root, target_pins)
+        root.links.append(
+            Link(src_ctx=MagicMock(), parent=root, source=source, target=target)
+        )
+
+        output_cache = {i.addr: i for i in _all_descendants(root)}
+        monkeypatch.setattr(lofty, "_output_cache", output_cache)
+        return root
+
+    return _make
+
+
+def test_get_nets_joins_matching_interface_pins(linked_interfaces):
+    root = linked_interfaces(["p1", "p2"], ["p1", "p2"])
+
+    nets = {frozenset(net) for net in get_nets(root.addr)}
+
+    assert nets == {
+        frozenset({"test.ato:Root::a.p1", "test.ato:Root::b.p1"}),
+        frozenset({"test.ato:Root::a.p2", "test.ato:Root::b.p2"}),
+    }
+
+
+def test_get_nets_missing_interface_pin(linked_interfaces):
+    root = linked_interfaces(["p1", "p2"], ["p1"])
+
+    with pytest.raises(errors.AtoKeyError):
+        get_nets(root.addr)